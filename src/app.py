@@ -5,8 +5,12 @@ from google.cloud import firestore
 from google.oauth2 import service_account
 import json
 import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from executor import extract_details_from_img, extract_details_from_txt, find_best_candidate
 
+COURSE_TITLE_COLUMN = 'course_title'
+
 # --- Firestore Connection ---
 
 def get_firestore_client():
@@ -44,7 +48,9 @@ def load_single_collection(_collection_name):
 def load_all_data_cached():
     """Loads all necessary collections from Firestore and caches the result."""
     collections_to_load = ["individuals", "properties", "microcourses", "skills", "jobs"]
-    data = {name: load_single_collection(name) for name in collections_to_load}
+    # Each collection is an independent network round trip, so stream them concurrently.
+    with ThreadPoolExecutor(max_workers=len(collections_to_load)) as pool:
+        data = dict(zip(collections_to_load, pool.map(load_single_collection, collections_to_load)))
     
     # Add sample jobs if the collection is empty or doesn't exist
     if 'jobs' not in data or data['jobs'].empty:
@@ -52,53 +58,82 @@ def load_all_data_cached():
             {"job_id": "JOB001", "job_title": "Part-Time Administrative Assistant", "required_skills": ["SKILL002", "SKILL009", "SKILL020"]},
             {"job_id": "JOB002", "job_title": "Entry-Level IT Support", "required_skills": ["SKILL001", "SKILL018"]},
         ])
+
+    # Cached together with the data, so the lookups are built once per load, not on every rerun.
+    data["lookups"] = build_path_lookups(data)
     return data
 
+def build_path_lookups(data):
+    """Precomputes the lookups PathfinderAgent uses over the loaded collections."""
+    lookups = {}
+
+    # Index individuals by id so profile lookups don't scan the whole DataFrame.
+    # The first row wins if an id is duplicated.
+    lookups["individual_rows"] = {}
+    individuals_df = data.get("individuals", pd.DataFrame())
+    if not individuals_df.empty and 'individual_id' in individuals_df.columns:
+        for row, individual_id in enumerate(individuals_df["individual_id"]):
+            lookups["individual_rows"].setdefault(individual_id, row)
+
+    # Freeze each job's required skills, so matching is a hashed subset test.
+    lookups["job_skill_sets"] = None
+    jobs_df = data.get("jobs", pd.DataFrame())
+    if not jobs_df.empty and 'required_skills' in jobs_df.columns:
+        lookups["job_skill_sets"] = jobs_df["required_skills"].map(frozenset)
+
+    # Course titles are matched case-insensitively on every path, so lowercase them up front.
+    lookups["course_titles_lc"] = None
+    microcourses_df = data.get("microcourses", pd.DataFrame())
+    if not microcourses_df.empty and COURSE_TITLE_COLUMN in microcourses_df.columns:
+        lookups["course_titles_lc"] = microcourses_df[COURSE_TITLE_COLUMN].astype(str).str.lower()
+
+    return lookups
+
 # --- Agentic Workflow ---
-# (No changes needed in this class)
 class PathfinderAgent:
     """Agent for generating educational and career paths."""
     def __init__(self, data):
         self.data = data
+        # Normally precomputed by load_all_data_cached; only built here for uncached data.
+        self._lookups = data["lookups"] if "lookups" in data else build_path_lookups(data)
 
     def get_user_profile(self, individual_id):
-        user_profile_df = self.data["individuals"][self.data["individuals"]["individual_id"] == individual_id]
-        return user_profile_df.to_dict('records')[0] if not user_profile_df.empty else None
+        row = self._lookups["individual_rows"].get(individual_id)
+        return self.data["individuals"].iloc[[row]].to_dict('records')[0] if row is not None else None
 
     def generate_educational_path(self, user_profile):
         if not user_profile: return None
         user_interests = user_profile.get("preferences", {}).get("learning_interests", [])
         recommended_courses = []
-        microcourses_df = self.data.get("microcourses", pd.DataFrame())
-        COURSE_TITLE_COLUMN = 'course_title'
+        gained_skill_ids = set()
 
-        if not microcourses_df.empty and COURSE_TITLE_COLUMN in microcourses_df.columns:
+        course_titles_lc = self._lookups["course_titles_lc"]
+        if course_titles_lc is not None:
+            microcourses_df = self.data["microcourses"]
             for interest in user_interests:
                 # This logic checks if any word from the interest matches in the course title.
                 # A better long-term solution would be to use skill_ids for matching.
-                mask = microcourses_df[COURSE_TITLE_COLUMN].astype(str).str.contains(interest, case=False, na=False)
+                mask = course_titles_lc.str.contains(interest.lower(), regex=False)
                 matching_courses = microcourses_df[mask]
-                if not matching_courses.empty:
-                    recommended_courses.extend(matching_courses.to_dict('records'))
+                # Collect the skills each course teaches in the same pass that gathers the course.
+                for course in matching_courses.to_dict('records'):
+                    recommended_courses.append(course)
+                    gained_skill_ids.update(course.get("skill_ids", []))
         else:
              st.warning(f"Warning: The '{COURSE_TITLE_COLUMN}' column was not found in the 'microcourses' data.")
 
-        gained_skill_ids = set()
-        for course in recommended_courses:
-            for skill_id in course.get("skill_ids", []):
-                gained_skill_ids.add(skill_id)
-
         all_skills = self.data.get("skills", pd.DataFrame())
         gained_skills = []
         if not all_skills.empty and 'skill_id' in all_skills.columns:
-            gained_skills = all_skills[all_skills["skill_id"].isin(list(gained_skill_ids))].to_dict('records')
+            gained_skills = all_skills[all_skills["skill_id"].isin(gained_skill_ids)].to_dict('records')
 
         job_opportunities = []
-        all_jobs = self.data.get("jobs", pd.DataFrame())
-        if not all_jobs.empty and 'required_skills' in all_jobs.columns:
-            for _, job in all_jobs.iterrows():
-                if set(job.get("required_skills", [])).issubset(gained_skill_ids):
-                    job_opportunities.append(job.to_dict())
+        job_skill_sets = self._lookups["job_skill_sets"]
+        if job_skill_sets is not None:
+            # Scan only the required skills and build row dicts just for the matches,
+            # instead of materialising a Series for every job with iterrows().
+            mask = job_skill_sets.map(gained_skill_ids.issuperset)
+            job_opportunities = self.data["jobs"][mask].to_dict('records')
 
         return {
             "individual_id": user_profile["individual_id"],
@@ -139,6 +174,19 @@ def save_generated_path(path_data):
     paths_ref.document(individual_id).set(path_data)
 
 
+# --- Display Templates ---
+
+# Row templates for the path results, rendered with str.format_map.
+COURSE_ROW_TEMPLATE = "- **{course_title}** by {provider_name}"
+JOB_ROW_TEMPLATE = "- **{job_title}**"
+COURSE_ROW_DEFAULTS = {"course_title": "N/A Title"}
+
+class _Defaulting(ChainMap):
+    """Non-copying view over a record (then any defaults) that renders other missing fields as 'N/A'."""
+    def __missing__(self, key):
+        return "N/A"
+
+
 # --- Streamlit UI ---
 
 st.set_page_config(page_title="Hope Pathways", layout="wide")
@@ -169,7 +217,7 @@ if db:
             selected_name = st.selectbox("Choose a person:", individual_names, key="path_user_select")
             
             if selected_name:
-                selected_id = individuals_df[individuals_df["contact_name"] == selected_name]["individual_id"].values[0]
+                selected_id = individuals_df.loc[individuals_df["contact_name"] == selected_name, "individual_id"].values[0]
                 user_profile = agent.get_user_profile(selected_id)
 
                 st.subheader(f"Profile for: {user_profile['contact_name']}")
@@ -186,8 +234,8 @@ if db:
                             st.success(f"Path successfully generated and saved for {user_profile['contact_name']}!")
                             
                             st.subheader("Step 1: Recommended Micro-Courses")
-                            for course in path["recommended_courses"]:
-                                st.markdown(f"- **{course.get('course_title', 'N/A Title')}** by {course.get('provider_name', 'N/A')}")
+                            # One markdown element per list rather than one per row.
+                            st.markdown("\n".join([COURSE_ROW_TEMPLATE.format_map(_Defaulting(course, COURSE_ROW_DEFAULTS)) for course in path["recommended_courses"]]))
 
                             st.subheader("Step 2: Skills You Will Gain")
                             st.markdown(" ".join([f"`{skill.get('skill_name', 'N/A')}`" for skill in path["gained_skills"]]))
@@ -196,8 +244,7 @@ if db:
                             if not path["job_opportunities"]:
                                 st.info("Complete the recommended courses to unlock job opportunities.")
                             else:
-                                for job in path["job_opportunities"]:
-                                    st.markdown(f"- **{job.get('job_title', 'N/A')}**")
+                                st.markdown("\n".join([JOB_ROW_TEMPLATE.format_map(_Defaulting(job)) for job in path["job_opportunities"]]))
     with tab2:
         st.header("Create a New Individual Profile")
         with st.form("new_user_form", clear_on_submit=True):
@@ -228,7 +275,7 @@ if db:
                     location_id = None
                     # Find the property_id for the selected location name
                     if selected_location_name and selected_location_name != "None":
-                        location_id = properties_df[properties_df["name"] == selected_location_name]["property_id"].values[0]
+                        location_id = properties_df.loc[properties_df["name"] == selected_location_name, "property_id"].values[0]
 
                     with st.spinner("Saving new user..."):
                         save_new_individual(name, email, interests, location_id) # Pass the new location_id
@@ -277,44 +324,50 @@ if db:
                         st.image(image_bytes, caption="Uploaded Job Description")
 
                         extracted_details = extract_details_from_img(image_bytes=image_bytes, mime_type="image/jpeg")
-                        st.success("Successfully extracted details from image!")
-                        st.json(extracted_details) # Display extracted details
-                        st.json(extracted_details["skills"])
+                        if extracted_details is None:
+                            st.error("Could not extract job details from the image. Please try again.")
+                        else:
+                            st.success("Successfully extracted details from image!")
+                            st.json(extracted_details) # Display extracted details
+                            st.json(extracted_details["skills"])
                         
 
-                # Case 2: User pasted text
-                elif job_text:
+                # Case 2: User pasted text (whitespace-only text counts as empty)
+                elif job_text.strip():
                     with st.spinner("Analyzing text with agentic workflow..."):
                         
                         st.success("Text received! Ready for processing.")
                         st.code(job_text, language="text")
                         
                         extracted_details = extract_details_from_txt(job_text)
-                        st.success("Successfully extracted details from text!")
-                        st.json(extracted_details) # Display extracted details
+                        if extracted_details is None:
+                            st.error("Could not extract job details from the text. Please try again.")
+                        else:
+                            st.success("Successfully extracted details from text!")
+                            st.json(extracted_details) # Display extracted details
 
-                        st.json(extracted_details["skills"])
+                            st.json(extracted_details["skills"])
 
-                        # 2. Load all your user data (you already do this with load_all_data_cached)
-                        all_users_df = data.get("individuals", pd.DataFrame())
-                        # Convert DataFrame to list of dictionaries for the function
-                        all_users_list = all_users_df.to_dict('records')
+                            # 2. Load all your user data (you already do this with load_all_data_cached)
+                            all_users_df = data.get("individuals", pd.DataFrame())
+                            # Convert DataFrame to list of dictionaries for the function
+                            all_users_list = all_users_df.to_dict('records')
 
-                        # 3. Call the function to get the best match
-                        if all_users_list:
-                            best_candidate = find_best_candidate(extracted_details["skills"], all_users_list, extracted_details)
+                            # 3. Call the function to get the best match
+                            if all_users_list:
+                                best_candidate = find_best_candidate(extracted_details["skills"], all_users_list, extracted_details)
 
-                            if best_candidate:
-                                st.subheader("Top Candidate Recommendation")
-                                # st.success(f"The best match for this job is **{best_candidate['contact_name']}**.")
+                                if best_candidate:
+                                    st.subheader("Top Candidate Recommendation")
+                                    # st.success(f"The best match for this job is **{best_candidate['contact_name']}**.")
                                 
-                                # You can display more details about the candidate here
-                                # candidate_skills = best_candidate.get("preferences", {}).get("learning_interests", [])
-                                st.write(best_candidate)
+                                    # You can display more details about the candidate here
+                                    # candidate_skills = best_candidate.get("preferences", {}).get("learning_interests", [])
+                                    st.write(best_candidate)
+                                else:
+                                    st.warning("Could not find a suitable candidate. No users with relevant skills were found.")
                             else:
-                                st.warning("Could not find a suitable candidate. No users with relevant skills were found.")
-                        else:
-                            st.info("No users in the database to match against.")
+                                st.info("No users in the database to match against.")
 
                 # Case 3: User submitted the form empty
                 else:
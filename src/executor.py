@@ -1,25 +1,98 @@
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
-import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 from sentence_transformers import SentenceTransformer, util
 import torch 
+from job_text_parser import parse_labelled_job_text
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class JobDetails(BaseModel):
     title: str
     desc: str
     skills: list[str]
 
+# Structured-output config shared by every extraction call; built once at import time.
+_JOB_DETAILS_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": JobDetails
+}
+
 # The client gets the API key from the environment variable `GEMINI_API_KEY`.
 client = genai.Client(
     api_key=os.getenv("api_key")
 )
 
 
+def _parse_job_details(response) -> JobDetails:
+    """Validates Gemini's reply against JobDetails, raising if it is empty or malformed."""
+    if not response.text:
+        raise ValueError("Gemini returned no text (the response may have been blocked)")
+    return JobDetails.model_validate_json(response.text)
+
+
+# Streamlit reruns the whole script on every interaction, so the same job posting is often
+# submitted more than once. Cache the validated JobDetails (callers take a fresh dict from it
+# with model_dump()) and skip the network round trip on a repeat. Blocked, empty or
+# malformed replies raise inside the cached call and are therefore never cached.
+#
+# Uploaded screenshots can be several MB each, so the image cache is keyed on a SHA-256
+# digest of the bytes instead of the bytes themselves (which lru_cache would keep alive).
+_IMG_DETAILS_CACHE_SIZE = 128
+_img_details_cache = OrderedDict()
+_img_details_cache_lock = threading.Lock()
+
+
+def _generate_details_from_img(image_bytes: bytes, mime_type: str) -> JobDetails:
+    key = (hashlib.sha256(image_bytes).hexdigest(), mime_type)
+    with _img_details_cache_lock:
+        details = _img_details_cache.get(key)
+        if details is not None:
+            _img_details_cache.move_to_end(key)
+            return details
+
+    response = client.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[
+            types.Part.from_bytes(
+                data=image_bytes,
+                mime_type=mime_type,
+            ),
+            'Extract job details',
+        ],
+        config=_JOB_DETAILS_CONFIG
+    )
+    details = _parse_job_details(response)
+
+    with _img_details_cache_lock:
+        _img_details_cache[key] = details
+        _img_details_cache.move_to_end(key)
+        if len(_img_details_cache) > _IMG_DETAILS_CACHE_SIZE:
+            _img_details_cache.popitem(last=False)
+    return details
+
+
+@lru_cache(maxsize=128)
+def _generate_details_from_txt(job_desc: str) -> JobDetails:
+    response = client.models.generate_content(
+        model="gemini-2.5-flash",
+        contents=[
+            f"Extract job details from the following: ```{job_desc}```",
+        ],
+        config=_JOB_DETAILS_CONFIG
+    )
+    return _parse_job_details(response)
+
+
 def extract_details_from_img(image_bytes: bytes, mime_type: str):
     """
     Analyzes an image of a job description using the Gemini API 
@@ -34,27 +107,10 @@ def extract_details_from_img(image_bytes: bytes, mime_type: str):
         or None if an error occurs.
     """
     try:
-
-        response = client.models.generate_content(
-        model='gemini-2.5-flash',
-        contents=[
-            types.Part.from_bytes(
-            data=image_bytes,
-            mime_type=mime_type,
-            ),
-            'Extract job details',
-            ],
-            config={
-                "response_mime_type": "application/json",
-                "response_schema": JobDetails
-            }
-        )
-
-        # The response.text will be a JSON string, so we parse it into a Python dict
-        return json.loads(response.text)
+        return _generate_details_from_img(image_bytes, mime_type).model_dump()
 
     except Exception as e:
-        print(f"An error occurred during AI processing: {e}")
+        logger.error("An error occurred during AI processing: %s", e)
         return None
 
 def extract_details_from_txt(job_desc: str):
@@ -71,25 +127,31 @@ def extract_details_from_txt(job_desc: str):
     Returns:
         dict | None: A dictionary containing the structured job details (title,
         company, description, skills) if the API call is successful. 
-        Returns None if an error occurs during the API call or processing.
+        Returns None if the text is blank or an error occurs during the API call
+        or processing.
     """
+    # Whitespace-only input cannot describe a job; don't spend a Gemini call on it.
+    if not job_desc or job_desc.isspace():
+        return None
+
+    details = parse_labelled_job_text(job_desc)
+    if details is not None:
+        return details
+
     try:
-        response = client.models.generate_content(
-        model="gemini-2.5-flash", 
-        contents=[
-            f"Extract job details from the following: ```{job_desc}```",
-        ],
-        config={
-            "response_mime_type": "application/json",
-            "response_schema": JobDetails
-        }
-        )
-        return json.loads(response.text)
+        return _generate_details_from_txt(job_desc).model_dump()
     except Exception as e:
-        print(f"An error occurred during AI processing: {e}")
+        logger.error("An error occurred during AI processing: %s", e)
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_embedding_model():
+    """Loads the sentence-transformer model on first use and reuses it for every later match."""
+    # 'all-MiniLM-L6-v2' is a good balance of speed and performance.
+    return SentenceTransformer('all-MiniLM-L6-v2')
+
+
 def find_best_candidate(job_skills: list[str], all_users: list[dict], job_details):
     """
     Finds the best matching user for a job based on skill similarity using sentence embeddings.
@@ -111,9 +173,8 @@ def find_best_candidate(job_skills: list[str], all_users: list[dict], job_detail
     if not all_users or not job_skills:
         return None
 
-    # 1. Load a pre-trained sentence-transformer model.
-    # 'all-MiniLM-L6-v2' is a good balance of speed and performance.
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # 1. Load a pre-trained sentence-transformer model (cached per process by _get_embedding_model).
+    model = _get_embedding_model()
 
     # 2. Prepare and embed the target job skills.
     # We combine the list of skills into a single descriptive string.
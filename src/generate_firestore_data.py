@@ -77,9 +77,41 @@ LEARNING_FORMATS = ["Online Self-Paced", "Online Live", "In-Person (Library)", "
 COURSE_COSTS = [0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 10.00, 25.00, 50.00] # Mostly free for this context
 
 # Common London street types and suffixes for realistic addresses
-STREET_TYPES = ["Road", "Street", "Lane", "Avenue", "Place", "Square", "Gardens", "Walk"]
+STREET_NAME_PREFIXES = ["High", "Church", "Park", "Main", "Oak", "Elm", "Station", "Market", "Green", "White"]
+STREET_TYPES = ["Road", "Street", "Lane", "Avenue", "Place", "Square", "Gardens", "Walk", "Close", "Terrace"]
+POSTCODE_AREAS = ["SW", "SE", "NW", "N", "E", "W", "WC", "EC"]
 POSTCODE_PREFIXES = ["EC1", "WC1", "SW1", "SE1", "N1", "NW1", "E1", "W1", "E2", "N7", "SE11", "SW8"] # Expanded for more variety
 
+# Choice lists used by the per-record generators below. Kept at module level so they are
+# built once instead of being re-allocated for every generated record.
+FIRST_NAMES = ["Alex", "Jamie", "Chris", "Sam", "Pat", "Taylor", "Jordan", "Casey"]
+LAST_NAMES = ["Smith", "Jones", "Brown", "Williams", "Johnson", "Davies", "Evans", "Wilson"]
+GENDERS = ["Male", "Female", "Non-binary", "Prefer not to say"]
+SHELTER_PREFERENCES = [
+    "women_only", "men_only", "family_friendly", "quiet_environment",
+    "pet_friendly", "disability_access", "mental_health_support", "no_religious_affiliation"
+]
+PAST_EXPERIENCES = [
+    "negative_shelter_experience", "positive_shelter_experience",
+    "struggled_with_online_learning", "successful_online_learning"
+]
+PROPERTY_TYPES = ["Hostel Room", "Shelter Bed", "Temporary Flat"]
+AVAILABILITY_STATUSES = ["Available", "Occupied", "Allocated"]
+ACCESSIBILITY_FEATURES = ["Wheelchair accessible", "Ground floor", "Lift access", "Sensory friendly"]
+PROPERTY_NOTES = [
+    "Quiet environment.", "Communal kitchen available.", "Strict no-alcohol policy.",
+    "Women and children only.", "Men only.", "Pet-friendly (small animals).",
+    "On-site mental health support.", "No religious affiliation.", "Referral required."
+]
+FLAT_NAMES = ["London Affordable Housing", "City Respite Homes"]
+HOUSING_PROVIDERS = ["London Housing Charity", "City Council Housing", "Homeless Aid UK"]
+COURSE_PROVIDERS = ["London Skills Hub", "Future Learn UK", "Digital Growth Institute", "Community Learning London"]
+COURSE_ACTIVE_FLAGS = [True, True, True, False] # Mostly active
+EMAIL_DOMAINS = ["example.com", "mail.org", "service.co.uk"]
+FOOD_BANK_CAPACITY_INFO = ["Well-stocked.", "Limited supplies, call ahead."]
+FOOD_BANK_NOTES = ["Requires referral.", "Walk-ins welcome.", "Offers hygiene kits."]
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri"]
+
 # --- Helper Functions for Generating Realistic Data ---
 
 def generate_random_london_coordinates(base_point: Point, max_offset_km=7):
@@ -99,13 +131,12 @@ def generate_random_london_coordinates(base_point: Point, max_offset_km=7):
 def generate_london_address(base_point: Point):
     """Generates a synthetic London address with a plausible postcode."""
     street_number = random.randint(1, 200)
-    street_name_part1 = random.choice(["High", "Church", "Park", "Main", "Oak", "Elm", "Station", "Market", "Green", "White"])
-    street_name_part2 = random.choice(["Road", "Street", "Lane", "Avenue", "Place", "Square", "Gardens", "Walk", "Close", "Terrace"])
+    street_name_part1 = random.choice(STREET_NAME_PREFIXES)
+    street_name_part2 = random.choice(STREET_TYPES)
     street_name = f"{street_name_part1} {street_name_part2}"
 
     # More diverse London postcodes
-    postcode_areas = ["SW", "SE", "NW", "N", "E", "W", "WC", "EC"]
-    postcode_prefix = random.choice(postcode_areas) + str(random.randint(1, 9))
+    postcode_prefix = random.choice(POSTCODE_AREAS) + str(random.randint(1, 9))
     postcode_suffix = f"{random.randint(1,9)}{random.choice('ABCDEFGHJKLMNPQRSTUVWXY')}{random.choice('ABCDEFGHJKLMNPQRSTUVWXY')}"
     return f"{street_number} {street_name}, London {postcode_prefix} {postcode_suffix}"
 
@@ -115,8 +146,7 @@ def generate_uk_phone_number():
 
 def generate_email(name_prefix):
     """Generates a synthetic email address."""
-    domains = ["example.com", "mail.org", "service.co.uk"]
-    return f"{name_prefix.lower().replace(' ', '.')}{random.randint(1, 99)}@{random.choice(domains)}"
+    return f"{name_prefix.lower().replace(' ', '.')}{random.randint(1, 99)}@{random.choice(EMAIL_DOMAINS)}"
 
 def generate_website(name_prefix):
     """Generates a synthetic website URL."""
@@ -134,22 +164,14 @@ def get_random_date(start_year=2020, end_year=2025):
 
 def generate_individual(individual_id):
     """Generates a synthetic individual profile."""
-    first_names = ["Alex", "Jamie", "Chris", "Sam", "Pat", "Taylor", "Jordan", "Casey"]
-    last_names = ["Smith", "Jones", "Brown", "Williams", "Johnson", "Davies", "Evans", "Wilson"]
-    contact_name = f"{random.choice(first_names)} {random.choice(last_names)}"
-    gender = random.choice(["Male", "Female", "Non-binary", "Prefer not to say"])
+    contact_name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+    gender = random.choice(GENDERS)
     dob = get_random_date(1970, 2000) # Educated demographic implies adult age range
 
     # Simulate preferences for matching
-    shelter_preferences = random.sample([
-        "women_only", "men_only", "family_friendly", "quiet_environment",
-        "pet_friendly", "disability_access", "mental_health_support", "no_religious_affiliation"
-    ], k=random.randint(1, 3))
+    shelter_preferences = random.sample(SHELTER_PREFERENCES, k=random.randint(1, 3))
     learning_interests = random.sample(SKILL_NAMES, k=random.randint(1, 4))
-    past_experiences = random.sample([
-        "negative_shelter_experience", "positive_shelter_experience",
-        "struggled_with_online_learning", "successful_online_learning"
-    ], k=random.randint(0, 1)) # Can be empty
+    past_experiences = random.sample(PAST_EXPERIENCES, k=random.randint(0, 1)) # Can be empty
 
     return {
         "individual_id": f"IND{individual_id:03d}",
@@ -175,12 +197,12 @@ def generate_property(property_id):
     """Generates a synthetic property (shelter/hostel) entry."""
     base_point = random.choice(LONDON_CENTRAL_POINTS)
     lat, lon = generate_random_london_coordinates(base_point)
-    property_type = random.choice(["Hostel Room", "Shelter Bed", "Temporary Flat"])
+    property_type = random.choice(PROPERTY_TYPES)
     housing_type = "Temporary"
     capacity = random.randint(5, 50)
     
     # Simulate availability
-    availability_status = random.choice(["Available", "Occupied", "Allocated"])
+    availability_status = random.choice(AVAILABILITY_STATUSES)
     if availability_status == "Available":
         beds_available = random.randint(1, capacity // 2) # Some beds available
         capacity_info = f"{beds_available} beds available (as of {datetime.now().strftime('%I:%M %p GMT')})."
@@ -189,20 +211,12 @@ def generate_property(property_id):
     else: # Allocated
         capacity_info = "Allocated, check back later."
 
-    accessibility_features = random.sample([
-        "Wheelchair accessible", "Ground floor", "Lift access", "Sensory friendly"
-    ], k=random.randint(0, 2))
-
-    notes_options = [
-        "Quiet environment.", "Communal kitchen available.", "Strict no-alcohol policy.",
-        "Women and children only.", "Men only.", "Pet-friendly (small animals).",
-        "On-site mental health support.", "No religious affiliation.", "Referral required."
-    ]
-    notes = random.sample(notes_options, k=random.randint(1, 3))
+    accessibility_features = random.sample(ACCESSIBILITY_FEATURES, k=random.randint(0, 2))
+    notes = random.sample(PROPERTY_NOTES, k=random.randint(1, 3))
 
     return {
         "property_id": f"PROP{property_id:03d}",
-        "name": random.choice(SHELTER_NAMES if property_type != "Temporary Flat" else ["London Affordable Housing", "City Respite Homes"]),
+        "name": random.choice(SHELTER_NAMES if property_type != "Temporary Flat" else FLAT_NAMES),
         "address": generate_london_address(base_point),
         "city": "London",
         "postcode": random.choice(POSTCODE_PREFIXES) + " " + f"{random.randint(1,9)}{random.choice('ABCDEFGHJKLMNPQRSTUVWXY')}{random.choice('ABCDEFGHJKLMNPQRSTUVWXY')}",
@@ -213,7 +227,7 @@ def generate_property(property_id):
         "availability_status": availability_status, # For filtering
         "capacity_info": capacity_info, # For display
         "last_available_date": get_random_date(2024, 2025), # Date it last became available
-        "provider_name": random.choice(["London Housing Charity", "City Council Housing", "Homeless Aid UK"]),
+        "provider_name": random.choice(HOUSING_PROVIDERS),
         "weekly_cost": 0.00, # Assuming free for target users
         "latitude": round(lat, 6),
         "longitude": round(lon, 6),
@@ -300,10 +314,10 @@ def generate_microcourse(course_id, all_skills):
         "duration_hours": duration,
         "learning_format": learning_format,
         "cost": cost,
-        "provider_name": random.choice(["London Skills Hub", "Future Learn UK", "Digital Growth Institute", "Community Learning London"]),
+        "provider_name": random.choice(COURSE_PROVIDERS),
         "start_date": start_date,
         "end_date": end_date,
-        "is_active": random.choice([True, True, True, False]), # Mostly active
+        "is_active": random.choice(COURSE_ACTIVE_FLAGS),
         "skill_ids": skill_ids # Array of skill IDs
     }
 
@@ -328,9 +342,9 @@ def generate_all_synthetic_data():
             prop["housing_type"] = "N/A"
             prop["capacity"] = 0 # N/A for food banks
             prop["availability_status"] = "Always Available"
-            prop["capacity_info"] = random.choice(["Well-stocked.", "Limited supplies, call ahead."])
+            prop["capacity_info"] = random.choice(FOOD_BANK_CAPACITY_INFO)
             prop["hours"] = generate_hours(is_shelter=False) # Re-use hours logic
-            prop["notes"] = random.choice(["Requires referral.", "Walk-ins welcome.", "Offers hygiene kits."])
+            prop["notes"] = random.choice(FOOD_BANK_NOTES)
         else: # It's a shelter/hostel
             prop["hours"] = generate_hours(is_shelter=True) # Re-use hours logic
         properties_data.append(prop)
@@ -360,7 +374,7 @@ def generate_hours(is_shelter: bool):
         # Food banks typically open during day, often limited days
         start_hour = random.randint(9, 11)
         end_hour = random.randint(13, 16)
-        days = random.sample(["Mon", "Tue", "Wed", "Thu", "Fri"], k=random.randint(2, 4))
+        days = random.sample(WEEKDAYS, k=random.randint(2, 4))
         days_str = ", ".join(sorted(days))
         return f"{days_str}: {start_hour}:00 - {end_hour}:00"
 
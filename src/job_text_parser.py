@@ -0,0 +1,99 @@
+"""Local parser for job text that already labels its title, description and skills.
+
+Job text pasted in the "Title: ... / Description: ... / Skills: ..." shape already carries
+every JobDetails field, so it can be parsed without a Gemini round trip. The parser only
+accepts input it can read unambiguously; everything else returns None and goes to Gemini.
+"""
+
+import re
+
+_LABEL_RE = re.compile(
+    r"^[ \t]*(job title|title|job description|description|skills)[ \t]*:",
+    re.IGNORECASE | re.MULTILINE,
+)
+_LABEL_TO_FIELD = {
+    "job title": "title",
+    "title": "title",
+    "job description": "desc",
+    "description": "desc",
+    "skills": "skills",
+}
+_BULLET_RE = re.compile(r"^[-*•][ \t]+(.+)$")
+
+
+def _split_skill_list(line: str):
+    """Splits a one-line skill list on commas/semicolons outside parentheses.
+
+    Returns None if the parentheses don't balance.
+    """
+    skills, current, depth = [], [], 0
+    for char in line:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif char in ",;" and depth == 0:
+            skills.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if depth:
+        return None
+    skills.append("".join(current))
+    return skills
+
+
+def _parse_skills(section: str):
+    """Returns the skills listed in a "Skills:" section, or None if the section is ambiguous.
+
+    Accepted shapes are a single comma/semicolon separated line, or lines that each start
+    with a bullet ("-", "*" or "•"). Any other line (e.g. closing prose such as
+    "Apply by Friday") makes the section ambiguous.
+    """
+    lines = [line.strip() for line in section.splitlines() if line.strip()]
+    if len(lines) == 1 and not _BULLET_RE.match(lines[0]):
+        skills = _split_skill_list(lines[0])
+        if skills is None:
+            return None
+    else:
+        bullets = [_BULLET_RE.match(line) for line in lines]
+        if not all(bullets):
+            return None
+        skills = [bullet.group(1) for bullet in bullets]
+
+    skills = [skill.strip() for skill in skills if skill.strip()]
+    if not skills or any(":" in skill for skill in skills):
+        return None
+    return skills
+
+
+def parse_labelled_job_text(job_desc: str):
+    """Returns a JobDetails-shaped dict for fully labelled job text, or None if Gemini is needed.
+
+    Each label's value runs up to the next recognised label, so wrapped or multi-paragraph
+    descriptions are kept whole. Anything the parser cannot place with confidence (text
+    before the first label, a repeated label, a title spanning several lines, a skills
+    section that is not a plain list) is left to Gemini.
+    """
+    labels = list(_LABEL_RE.finditer(job_desc))
+    if not labels or job_desc[:labels[0].start()].strip():
+        return None
+
+    fields = {}
+    for label, next_label in zip(labels, labels[1:] + [None]):
+        field = _LABEL_TO_FIELD[label.group(1).lower()]
+        if field in fields:
+            return None
+        end = next_label.start() if next_label else len(job_desc)
+        fields[field] = job_desc[label.end():end].strip()
+    if fields.keys() != {"title", "desc", "skills"}:
+        return None
+    if not fields["title"] or "\n" in fields["title"] or not fields["desc"]:
+        return None
+
+    skills = _parse_skills(fields["skills"])
+    if skills is None:
+        return None
+    return {"title": fields["title"], "desc": fields["desc"], "skills": skills}
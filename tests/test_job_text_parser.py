@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from job_text_parser import parse_labelled_job_text
+
+
+class ParseLabelledJobTextTest(unittest.TestCase):
+    def test_single_line_skill_list(self):
+        details = parse_labelled_job_text(
+            "Title: Admin Assistant\n"
+            "Description: We are looking for someone to\n"
+            "handle phones, filing and scheduling.\n"
+            "Skills: MS Office, Data Entry"
+        )
+        self.assertEqual(details, {
+            "title": "Admin Assistant",
+            "desc": "We are looking for someone to\nhandle phones, filing and scheduling.",
+            "skills": ["MS Office", "Data Entry"],
+        })
+
+    def test_bulleted_skill_list(self):
+        details = parse_labelled_job_text(
+            "Job Title: Admin\nDescription: Para one.\n\nPara two.\n"
+            "Skills:\n- MS Office\n* Communication (verbal, written)\n• Typing"
+        )
+        self.assertEqual(details["desc"], "Para one.\n\nPara two.")
+        self.assertEqual(details["skills"], ["MS Office", "Communication (verbal, written)", "Typing"])
+
+    def test_does_not_split_inside_parentheses(self):
+        details = parse_labelled_job_text(
+            "Title: Dev\nDescription: x\nSkills: Communication (verbal, written), Python"
+        )
+        self.assertEqual(details["skills"], ["Communication (verbal, written)", "Python"])
+
+    def test_prose_after_skills_goes_to_gemini(self):
+        self.assertIsNone(parse_labelled_job_text(
+            "Title: Dev\nDescription: x\nSkills: python\n\nApply at foo@bar.com by Friday"
+        ))
+        self.assertIsNone(parse_labelled_job_text(
+            "Title: Dev\nDescription: x\nSkills:\n- python\nWe are an equal opportunity employer"
+        ))
+
+    def test_ambiguous_input_goes_to_gemini(self):
+        for job_desc in [
+            "Job Title: Administrative Assistant\nCompany: Acme Corp\nSkills: Microsoft Office",
+            "Hiring now!\nTitle: a\nDescription: b\nSkills: c",
+            "Title: a\nTitle: b\nDescription: b\nSkills: c",
+            "Job Title: Admin\nCompany: Acme\nDescription: x\nSkills: a",
+            "Title: a\nDescription: b\nSkills: ,",
+            "Title: a\nDescription: b\nSkills: Salary: 25k",
+            "Title: a\nDescription: b\nSkills: Communication (verbal, Python",
+        ]:
+            with self.subTest(job_desc=job_desc):
+                self.assertIsNone(parse_labelled_job_text(job_desc))
+
+
+if __name__ == "__main__":
+    unittest.main()